@@ -7,7 +7,7 @@ import sympy as sp
 
 from rednose.helpers.ekf_sym import EKF_sym, gen_code
 from selfdrive.locationd.models.constants import ObservationKind
-from selfdrive.locationd.models.loc_kf import parse_pr, parse_prr
+from selfdrive.locationd.models.loc_kf import parse_pr_batch, parse_prr_batch
 
 
 class States():
@@ -156,25 +156,11 @@ class GNSSKalman():
     return r
 
   def predict_and_update_pseudorange(self, meas, t, kind):
-    R = np.zeros((len(meas), 1, 1))
-    sat_pos_freq = np.zeros((len(meas), 4))
-    z = np.zeros((len(meas), 1))
-    for i, m in enumerate(meas):
-      z_i, R_i, sat_pos_freq_i = parse_pr(m)
-      sat_pos_freq[i, :] = sat_pos_freq_i
-      z[i, :] = z_i
-      R[i, :, :] = R_i
+    z, R, sat_pos_freq = parse_pr_batch(meas)
     return self.filter.predict_and_update_batch(t, kind, z, R, sat_pos_freq)
 
   def predict_and_update_pseudorange_rate(self, meas, t, kind):
-    R = np.zeros((len(meas), 1, 1))
-    z = np.zeros((len(meas), 1))
-    sat_pos_vel = np.zeros((len(meas), 6))
-    for i, m in enumerate(meas):
-      z_i, R_i, sat_pos_vel_i = parse_prr(m)
-      sat_pos_vel[i] = sat_pos_vel_i
-      R[i, :, :] = R_i
-      z[i, :] = z_i
+    z, R, sat_pos_vel = parse_prr_batch(meas)
     return self.filter.predict_and_update_batch(t, kind, z, R, sat_pos_vel)
 
 
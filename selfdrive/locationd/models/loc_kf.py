@@ -33,6 +33,32 @@ def parse_pr(m):
   return z_i, R_i, sat_pos_freq_i
 
 
+def parse_prr_batch(meas):
+  from laika.raw_gnss import GNSSMeasurement
+  z = np.zeros((len(meas), 1))
+  R = np.zeros((len(meas), 1, 1))
+  sat_pos_vel = np.zeros((len(meas), 6))
+  if len(meas) > 0:
+    z[:, 0] = meas[:, GNSSMeasurement.PRR]
+    R[:, 0, 0] = meas[:, GNSSMeasurement.PRR_STD]**2
+    sat_pos_vel[:, :3] = meas[:, GNSSMeasurement.SAT_POS]
+    sat_pos_vel[:, 3:] = meas[:, GNSSMeasurement.SAT_VEL]
+  return z, R, sat_pos_vel
+
+
+def parse_pr_batch(meas):
+  from laika.raw_gnss import GNSSMeasurement
+  z = np.zeros((len(meas), 1))
+  R = np.zeros((len(meas), 1, 1))
+  sat_pos_freq = np.zeros((len(meas), 4))
+  if len(meas) > 0:
+    z[:, 0] = meas[:, GNSSMeasurement.PR]
+    R[:, 0, 0] = meas[:, GNSSMeasurement.PR_STD]**2
+    sat_pos_freq[:, :3] = meas[:, GNSSMeasurement.SAT_POS]
+    sat_pos_freq[:, 3] = meas[:, GNSSMeasurement.GLONASS_FREQ]
+  return z, R, sat_pos_freq
+
+
 class States():
   ECEF_POS = slice(0, 3)  # x, y and z in ECEF in meters
   ECEF_ORIENTATION = slice(3, 7)  # quat for orientation of phone in ecef
@@ -449,25 +475,11 @@ class LocKalman():
     return R
 
   def predict_and_update_pseudorange(self, meas, t, kind):
-    R = np.zeros((len(meas), 1, 1))
-    sat_pos_freq = np.zeros((len(meas), 4))
-    z = np.zeros((len(meas), 1))
-    for i, m in enumerate(meas):
-      z_i, R_i, sat_pos_freq_i = parse_pr(m)
-      sat_pos_freq[i, :] = sat_pos_freq_i
-      z[i, :] = z_i
-      R[i, :, :] = R_i
+    z, R, sat_pos_freq = parse_pr_batch(meas)
     return self.filter.predict_and_update_batch(t, kind, z, R, sat_pos_freq)
 
   def predict_and_update_pseudorange_rate(self, meas, t, kind):
-    R = np.zeros((len(meas), 1, 1))
-    z = np.zeros((len(meas), 1))
-    sat_pos_vel = np.zeros((len(meas), 6))
-    for i, m in enumerate(meas):
-      z_i, R_i, sat_pos_vel_i = parse_prr(m)
-      sat_pos_vel[i] = sat_pos_vel_i
-      R[i, :, :] = R_i
-      z[i, :] = z_i
+    z, R, sat_pos_vel = parse_prr_batch(meas)
     return self.filter.predict_and_update_batch(t, kind, z, R, sat_pos_vel)
 
   def predict_and_update_odo_trans(self, trans, t, kind):